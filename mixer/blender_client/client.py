@@ -38,7 +38,7 @@ import os
 import struct
 import time
 import traceback
-from typing import Dict, Tuple, Optional
+from typing import Callable, Dict, Mapping, Tuple, Optional
 from enum import IntEnum
 
 import bpy
@@ -127,6 +127,11 @@ def delayed_message_call(func, *args, **kwargs):
     return wrapper
 
 
+def _data_handler(build: Callable[[bytes], None]) -> Callable[["BlenderClient", bytes], None]:
+    """Adapt a module level build function to the BlenderClient._build_handlers signature"""
+    return lambda _client, data: build(data)
+
+
 class BlenderClient(Client):
     """
     Client specialized for Blender. Extends Client base class by adding and handling data related to Blender.
@@ -854,6 +859,62 @@ class BlenderClient(Client):
     def query_current_frame(self):
         share_data.client.send_frame(bpy.context.scene.frame_current)
 
+    # Message types that network_consumer() processes uniformly, mapped to the function that builds them
+    # from the command data. Called as handler(self, command.data)
+    _build_handlers: Mapping[MessageType, Callable[["BlenderClient", bytes], None]] = {
+        MessageType.GREASE_PENCIL_MESH: _data_handler(grease_pencil_api.build_grease_pencil_mesh),
+        MessageType.GREASE_PENCIL_MATERIAL: _data_handler(grease_pencil_api.build_grease_pencil_material),
+        MessageType.GREASE_PENCIL_CONNECTION: _data_handler(grease_pencil_api.build_grease_pencil_connection),
+        MessageType.MESH: build_mesh,
+        MessageType.TRANSFORM: build_transform,
+        MessageType.MATERIAL: _data_handler(material_api.build_material),
+        MessageType.ASSIGN_MATERIAL: _data_handler(material_api.build_assign_material),
+        MessageType.DELETE: build_delete,
+        MessageType.CAMERA: _data_handler(camera_api.build_camera),
+        MessageType.LIGHT: _data_handler(light_api.build_light),
+        MessageType.RENAME: build_rename,
+        MessageType.DUPLICATE: build_duplicate,
+        MessageType.SEND_TO_TRASH: build_send_to_trash,
+        MessageType.RESTORE_FROM_TRASH: build_restore_from_trash,
+        MessageType.TEXTURE: build_texture_file,
+        MessageType.COLLECTION: _data_handler(collection_api.build_collection),
+        MessageType.COLLECTION_REMOVED: _data_handler(collection_api.build_collection_removed),
+        MessageType.INSTANCE_COLLECTION: _data_handler(collection_api.build_collection_instance),
+        MessageType.ADD_COLLECTION_TO_COLLECTION: _data_handler(collection_api.build_collection_to_collection),
+        MessageType.REMOVE_COLLECTION_FROM_COLLECTION: _data_handler(
+            collection_api.build_remove_collection_from_collection
+        ),
+        MessageType.ADD_OBJECT_TO_COLLECTION: _data_handler(collection_api.build_add_object_to_collection),
+        MessageType.REMOVE_OBJECT_FROM_COLLECTION: _data_handler(collection_api.build_remove_object_from_collection),
+        MessageType.ADD_COLLECTION_TO_SCENE: _data_handler(scene_api.build_collection_to_scene),
+        MessageType.REMOVE_COLLECTION_FROM_SCENE: _data_handler(scene_api.build_remove_collection_from_scene),
+        MessageType.ADD_OBJECT_TO_SCENE: _data_handler(scene_api.build_add_object_to_scene),
+        MessageType.REMOVE_OBJECT_FROM_SCENE: _data_handler(scene_api.build_remove_object_from_scene),
+        MessageType.SCENE: _data_handler(scene_api.build_scene),
+        MessageType.OBJECT_VISIBILITY: _data_handler(object_api.build_object_visibility),
+        MessageType.FRAME: build_frame,
+        MessageType.QUERY_CURRENT_FRAME: lambda self, data: self.query_current_frame(),
+        MessageType.FRAME_START_END: build_start_end_frame,
+        MessageType.PLAY: build_play,
+        MessageType.PAUSE: build_pause,
+        MessageType.ADD_KEYFRAME: build_add_keyframe,
+        MessageType.REMOVE_KEYFRAME: build_remove_keyframe,
+        MessageType.MOVE_KEYFRAME: build_move_keyframe,
+        MessageType.ANIMATION: build_add_animation,
+        MessageType.QUERY_ANIMATION_DATA: build_query_animation_data,
+        MessageType.CLEAR_ANIMATIONS: build_clear_animations,
+        MessageType.SHOT_MANAGER_MONTAGE_MODE: build_montage_mode,
+        MessageType.SHOT_MANAGER_ACTION: _data_handler(shot_manager.build_shot_manager_action),
+        MessageType.ADD_CONSTRAINT: _data_handler(constraint_api.build_add_constraint),
+        MessageType.REMOVE_CONSTRAINT: _data_handler(constraint_api.build_remove_constraint),
+        MessageType.SAVE: build_save,
+        MessageType.BLENDER_DATA_UPDATE: _data_handler(data_api.build_data_update),
+        MessageType.BLENDER_DATA_REMOVE: _data_handler(data_api.build_data_remove),
+        MessageType.BLENDER_DATA_CREATE: _data_handler(data_api.build_data_create),
+        MessageType.BLENDER_DATA_RENAME: _data_handler(data_api.build_data_rename),
+        MessageType.BLENDER_DATA_MEDIA: _data_handler(data_api.build_data_media),
+    }
+
     def compute_client_custom_attributes(self):
         scene_attributes = {}
         for scene in bpy.data.scenes:
@@ -993,129 +1054,22 @@ class BlenderClient(Client):
                     # because it can lead to ignoring real updates when a false positive is encountered
                     command_triggers_depsgraph_update = True
 
-                    if command.type == MessageType.GREASE_PENCIL_MESH:
-                        grease_pencil_api.build_grease_pencil_mesh(command.data)
-                    elif command.type == MessageType.GREASE_PENCIL_MATERIAL:
-                        grease_pencil_api.build_grease_pencil_material(command.data)
-                    elif command.type == MessageType.GREASE_PENCIL_CONNECTION:
-                        grease_pencil_api.build_grease_pencil_connection(command.data)
-
-                    elif command.type == MessageType.CLEAR_CONTENT:
+                    if command.type == MessageType.CLEAR_CONTENT:
                         clear_scene_content()
                         self._joining = True
                         self._received_command_count = 0
                         self._received_byte_size = 0
                         get_mixer_props().joining_percentage = 0
                         redraw_panels()
-                    elif command.type == MessageType.MESH:
-                        self.build_mesh(command.data)
-                    elif command.type == MessageType.TRANSFORM:
-                        self.build_transform(command.data)
-                    elif command.type == MessageType.MATERIAL:
-                        material_api.build_material(command.data)
-                    elif command.type == MessageType.ASSIGN_MATERIAL:
-                        material_api.build_assign_material(command.data)
-                    elif command.type == MessageType.DELETE:
-                        self.build_delete(command.data)
-                    elif command.type == MessageType.CAMERA:
-                        camera_api.build_camera(command.data)
-                    elif command.type == MessageType.LIGHT:
-                        light_api.build_light(command.data)
-                    elif command.type == MessageType.RENAME:
-                        self.build_rename(command.data)
-                    elif command.type == MessageType.DUPLICATE:
-                        self.build_duplicate(command.data)
-                    elif command.type == MessageType.SEND_TO_TRASH:
-                        self.build_send_to_trash(command.data)
-                    elif command.type == MessageType.RESTORE_FROM_TRASH:
-                        self.build_restore_from_trash(command.data)
-                    elif command.type == MessageType.TEXTURE:
-                        self.build_texture_file(command.data)
-
-                    elif command.type == MessageType.COLLECTION:
-                        collection_api.build_collection(command.data)
-                    elif command.type == MessageType.COLLECTION_REMOVED:
-                        collection_api.build_collection_removed(command.data)
-
-                    elif command.type == MessageType.INSTANCE_COLLECTION:
-                        collection_api.build_collection_instance(command.data)
-
-                    elif command.type == MessageType.ADD_COLLECTION_TO_COLLECTION:
-                        collection_api.build_collection_to_collection(command.data)
-                    elif command.type == MessageType.REMOVE_COLLECTION_FROM_COLLECTION:
-                        collection_api.build_remove_collection_from_collection(command.data)
-                    elif command.type == MessageType.ADD_OBJECT_TO_COLLECTION:
-                        collection_api.build_add_object_to_collection(command.data)
-                    elif command.type == MessageType.REMOVE_OBJECT_FROM_COLLECTION:
-                        collection_api.build_remove_object_from_collection(command.data)
-
-                    elif command.type == MessageType.ADD_COLLECTION_TO_SCENE:
-                        scene_api.build_collection_to_scene(command.data)
-                    elif command.type == MessageType.REMOVE_COLLECTION_FROM_SCENE:
-                        scene_api.build_remove_collection_from_scene(command.data)
-                    elif command.type == MessageType.ADD_OBJECT_TO_SCENE:
-                        scene_api.build_add_object_to_scene(command.data)
-                    elif command.type == MessageType.REMOVE_OBJECT_FROM_SCENE:
-                        scene_api.build_remove_object_from_scene(command.data)
-
-                    elif command.type == MessageType.SCENE:
-                        scene_api.build_scene(command.data)
-
-                    elif command.type == MessageType.OBJECT_VISIBILITY:
-                        object_api.build_object_visibility(command.data)
-
-                    elif command.type == MessageType.FRAME:
-                        self.build_frame(command.data)
-                    elif command.type == MessageType.QUERY_CURRENT_FRAME:
-                        self.query_current_frame()
-                    elif command.type == MessageType.FRAME_START_END:
-                        self.build_start_end_frame(command.data)
-
-                    elif command.type == MessageType.PLAY:
-                        self.build_play(command.data)
-                    elif command.type == MessageType.PAUSE:
-                        self.build_pause(command.data)
-                    elif command.type == MessageType.ADD_KEYFRAME:
-                        self.build_add_keyframe(command.data)
-                    elif command.type == MessageType.REMOVE_KEYFRAME:
-                        self.build_remove_keyframe(command.data)
-                    elif command.type == MessageType.MOVE_KEYFRAME:
-                        self.build_move_keyframe(command.data)
-                    elif command.type == MessageType.ANIMATION:
-                        self.build_add_animation(command.data)
-                    elif command.type == MessageType.QUERY_ANIMATION_DATA:
-                        self.build_query_animation_data(command.data)
-
-                    elif command.type == MessageType.CLEAR_ANIMATIONS:
-                        self.build_clear_animations(command.data)
-                    elif command.type == MessageType.SHOT_MANAGER_MONTAGE_MODE:
-                        self.build_montage_mode(command.data)
-                    elif command.type == MessageType.SHOT_MANAGER_ACTION:
-                        shot_manager.build_shot_manager_action(command.data)
-
-                    elif command.type == MessageType.ADD_CONSTRAINT:
-                        constraint_api.build_add_constraint(command.data)
-                    elif command.type == MessageType.REMOVE_CONSTRAINT:
-                        constraint_api.build_remove_constraint(command.data)
                     elif command.type == MessageType.ASSET_BANK:
                         delayed_messages.append(delayed_message_call(asset_bank.receive_message, command.data))
-                    elif command.type == MessageType.SAVE:
-                        self.build_save(command.data)
-
-                    elif command.type == MessageType.BLENDER_DATA_UPDATE:
-                        data_api.build_data_update(command.data)
-                    elif command.type == MessageType.BLENDER_DATA_REMOVE:
-                        data_api.build_data_remove(command.data)
-                    elif command.type == MessageType.BLENDER_DATA_CREATE:
-                        data_api.build_data_create(command.data)
-                    elif command.type == MessageType.BLENDER_DATA_RENAME:
-                        data_api.build_data_rename(command.data)
-                    elif command.type == MessageType.BLENDER_DATA_MEDIA:
-                        data_api.build_data_media(command.data)
-
                     else:
-                        # Command is ignored, so no depsgraph update can be triggered
-                        command_triggers_depsgraph_update = False
+                        build_handler = self._build_handlers.get(command.type)
+                        if build_handler is not None:
+                            build_handler(self, command.data)
+                        else:
+                            # Command is ignored, so no depsgraph update can be triggered
+                            command_triggers_depsgraph_update = False
 
                     if command_triggers_depsgraph_update:
                         self.skip_next_depsgraph_update = True
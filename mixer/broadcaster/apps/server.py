@@ -51,6 +51,9 @@ _log_server_updates: bool = False
 # client, then release the room mutex while broadcasting
 MAX_BROADCAST_COMMAND_COUNT = 64
 
+# Outgoing commands are grouped into a single socket write, up to this size
+MAX_SEND_BYTE_SIZE = 1024 * 1024
+
 
 class Connection:
     """ Represent a connection with a client """
@@ -217,13 +220,30 @@ class Connection:
         self._server.handle_client_disconnect(self)
 
     def fetch_outgoing_commands(self):
+        commands: List[common.Command] = []
+        byte_size = 0
         while True:
             try:
                 command = self._command_queue.get_nowait()
             except queue.Empty:
                 break
 
-            self.send_command(command)
+            # flush first, so that a large command is not copied again with the commands before it
+            command_size = command.byte_size()
+            if commands and byte_size + command_size > MAX_SEND_BYTE_SIZE:
+                self._send_queued_commands(commands)
+                commands = []
+                byte_size = 0
+
+            commands.append(command)
+            byte_size += command_size
+
+        if commands:
+            self._send_queued_commands(commands)
+
+    def _send_queued_commands(self, commands: List[common.Command]):
+        self.send_commands(commands)
+        for _ in commands:
             self._command_queue.task_done()
 
     def add_command(self, command: common.Command):
@@ -237,12 +257,24 @@ class Connection:
         Directly send a command to the socket. Meant to be used by this thread.
         """
         assert threading.current_thread() is self.thread
+        self._log_send(command)
+        common.write_message(self.socket, command)
+
+    def send_commands(self, commands: List[common.Command]):
+        """
+        Directly send several commands to the socket with a single write. Meant to be used by this thread.
+        """
+        assert threading.current_thread() is self.thread
+        for command in commands:
+            self._log_send(command)
+        common.write_messages(self.socket, commands)
+
+    def _log_send(self, command: common.Command):
         if _log_server_updates or command.type not in (
             common.MessageType.CLIENT_UPDATE,
             common.MessageType.ROOM_UPDATE,
         ):
             logger.debug("Sending to %s:%s - %s", self.address[0], self.address[1], command.type)
-        common.write_message(self.socket, command)
 
 
 class Room:
@@ -82,9 +82,13 @@ class Client:
                 self.host,
                 self.port,
             )
-            self.send_command(common.Command(common.MessageType.CLIENT_ID))
-            self.send_command(common.Command(common.MessageType.LIST_CLIENTS))
-            self.send_command(common.Command(common.MessageType.LIST_ROOMS))
+            self.send_commands(
+                [
+                    common.Command(common.MessageType.CLIENT_ID),
+                    common.Command(common.MessageType.LIST_CLIENTS),
+                    common.Command(common.MessageType.LIST_ROOMS),
+                ]
+            )
         except ConnectionRefusedError:
             self.socket = None
         except common.ClientDisconnectedException:
@@ -118,7 +122,8 @@ class Client:
         """
         while self.is_connected():
             try:
-                received_commands = self.fetch_incoming_commands()
+                # block on the socket rather than spinning on an empty poll
+                received_commands = self.fetch_incoming_commands(timeout=1.0)
             except common.ClientDisconnectedException:
                 self.handle_connection_lost()
                 break
@@ -128,8 +133,11 @@ class Client:
         return False
 
     def send_command(self, command: common.Command):
+        return self.send_commands([command])
+
+    def send_commands(self, commands: List[common.Command]):
         try:
-            common.write_message(self.socket, command)
+            common.write_messages(self.socket, commands)
             return True
         except common.ClientDisconnectedException:
             self.handle_connection_lost()
@@ -245,13 +253,14 @@ class Client:
     def has_default_handler(self, message_type: MessageType):
         return message_type in self._default_command_handlers
 
-    def fetch_incoming_commands(self) -> List[common.Command]:
+    def fetch_incoming_commands(self, timeout: Optional[float] = None) -> List[common.Command]:
         """
         Gather incoming commands from the socket and return them as a list.
         Process those that have a default handler with the one registered.
+        If timeout is not None, wait at most timeout seconds for a first command to arrive.
         """
         try:
-            received_commands = common.read_all_messages(self.socket)
+            received_commands = common.read_all_messages(self.socket, timeout=timeout)
         except common.ClientDisconnectedException:
             self.handle_connection_lost()
             raise
@@ -567,22 +567,32 @@ def read_all_messages(socket: Socket, timeout: Optional[float] = None) -> List[C
     Try to read all messages waiting on the socket.
     Raise ClientDisconnectedException if the socket is disconnected.
     Return empty list if no message is waiting on the socket.
+
+    The timeout only applies to the first message, so that the caller can block until something arrives
+    and the messages already waiting are then drained without further delay.
     """
     received_commands: List[Command] = []
-    while True:
-        command = read_message(socket, timeout=timeout)
-        if command is None:
-            break
+    command = read_message(socket, timeout=timeout)
+    while command is not None:
         received_commands.append(command)
+        command = read_message(socket)
     return received_commands
 
 
 def write_message(sock: Optional[Socket], command: Command):
+    write_messages(sock, [command])
+
+
+def write_messages(sock: Optional[Socket], commands: List[Command]):
+    """
+    Write several commands with a single send, to save a system call per command.
+    """
     if not sock:
-        logger.warning("write_message called with no socket")
+        logger.warning("write_messages called with no socket")
         return
 
-    buffer = command.to_byte_buffer()
+    # no copy for a single command
+    buffer = b"".join([command.to_byte_buffer() for command in commands])
 
     try:
         _, w, _ = select.select([], [sock._socket], [])
@@ -0,0 +1,47 @@
+import socket
+import time
+import unittest
+
+from mixer.broadcaster.socket import Socket
+import mixer.broadcaster.common as common
+
+
+class TestReadWriteMessages(unittest.TestCase):
+    def setUp(self):
+        sender, receiver = socket.socketpair()
+        self._sender = Socket(sender)
+        self._receiver = Socket(receiver)
+
+    def tearDown(self):
+        self._sender.close()
+        self._receiver.close()
+
+    def test_write_messages_read_all(self):
+        commands = [common.Command(common.MessageType.TRANSFORM, common.encode_string(f"path_{i}")) for i in range(10)]
+        common.write_messages(self._sender, commands)
+
+        received = common.read_all_messages(self._receiver, timeout=1.0)
+        self.assertEqual(len(received), len(commands))
+        for command, received_command in zip(commands, received):
+            self.assertEqual(received_command.type, command.type)
+            self.assertEqual(received_command.id, command.id)
+            self.assertEqual(received_command.data, command.data)
+
+    def test_read_all_timeout_first_only(self):
+        # the timeout applies to the first message, the following ones are drained without waiting
+        common.write_message(self._sender, common.Command(common.MessageType.LIST_ROOMS))
+        common.write_message(self._sender, common.Command(common.MessageType.LIST_CLIENTS))
+
+        start = time.monotonic()
+        received = common.read_all_messages(self._receiver, timeout=1.0)
+        elapsed = time.monotonic() - start
+        self.assertEqual([c.type for c in received], [common.MessageType.LIST_ROOMS, common.MessageType.LIST_CLIENTS])
+        self.assertLess(elapsed, 0.5)
+
+    def test_read_all_empty(self):
+        timeout = 0.2
+        start = time.monotonic()
+        received = common.read_all_messages(self._receiver, timeout=timeout)
+        elapsed = time.monotonic() - start
+        self.assertEqual(received, [])
+        self.assertGreaterEqual(elapsed, timeout * 0.9)
@@ -1,10 +1,14 @@
+import socket
 import unittest
+from unittest import mock
 import threading
 import time
 
-from mixer.broadcaster.apps.server import Server
+import mixer.broadcaster.apps.server as server_module
+from mixer.broadcaster.apps.server import Connection, Server
 from mixer.broadcaster.client import Client
 import mixer.broadcaster.common as common
+from mixer.broadcaster.socket import Socket
 
 from tests.process import ServerProcess
 
@@ -203,3 +207,42 @@ class TestClient(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestConnection(unittest.TestCase):
+    def setUp(self):
+        sender, receiver = socket.socketpair()
+        self._sender = Socket(sender)
+        self._receiver = Socket(receiver)
+        self._connection = Connection(Server(), self._sender, ("127.0.0.1", 0))
+        # fetch_outgoing_commands() is meant to run on the connection thread
+        self._connection.thread = threading.current_thread()
+
+    def tearDown(self):
+        self._sender.close()
+        self._receiver.close()
+
+    def test_fetch_outgoing_commands_batches(self):
+        max_send_byte_size = 1000
+        commands = [common.Command(common.MessageType.TRANSFORM, bytes([i]) * 300) for i in range(10)]
+        # larger than the limit, sent on its own
+        commands.insert(5, common.Command(common.MessageType.MESH, b"m" * 2000))
+        for command in commands:
+            self._connection.add_command(command)
+
+        with mock.patch.object(server_module, "MAX_SEND_BYTE_SIZE", max_send_byte_size), mock.patch.object(
+            common, "write_messages", wraps=common.write_messages
+        ) as write_messages:
+            self._connection.fetch_outgoing_commands()
+
+        batches = [call.args[1] for call in write_messages.call_args_list]
+        self.assertGreater(len(batches), 1)
+        self.assertEqual([command for batch in batches for command in batch], commands)
+        for batch in batches:
+            self.assertTrue(len(batch) == 1 or sum(c.byte_size() for c in batch) <= max_send_byte_size)
+
+        # task_done() was called for each command
+        self.assertEqual(self._connection._command_queue.unfinished_tasks, 0)
+
+        received = common.read_all_messages(self._receiver, timeout=1.0)
+        self.assertEqual([(c.type, c.id, c.data) for c in received], [(c.type, c.id, c.data) for c in commands])
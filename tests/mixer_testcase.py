@@ -2,6 +2,7 @@
 Base class for test cases
 """
 import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import json
 import logging
@@ -16,7 +17,8 @@ from tests.grabber import Grabber, CommandStream
 from tests.process import ServerProcess
 
 import mixer.codec
-from mixer.broadcaster.common import Command, MessageType
+from mixer.broadcaster.client import Client
+from mixer.broadcaster.common import Command, MessageType, RoomAttributes
 from mixer.blender_data.types import Soa
 
 logging.basicConfig(stream=sys.stderr, level=logging.WARNING)
@@ -29,6 +31,17 @@ class BlenderDesc:
     wait_for_debugger: bool = False
 
 
+def _no_other_client(client: Client) -> bool:
+    return len(client.clients_attributes) == 1
+
+
+def _is_room_uploaded(client: Client, room_name: str) -> bool:
+    room_attributes = client.rooms_attributes.get(room_name, {})
+    joinable = room_attributes.get(RoomAttributes.JOINABLE, False)
+    keep_open = room_attributes.get(RoomAttributes.KEEP_OPEN, False)
+    return bool(joinable and keep_open)
+
+
 class MixerTestCase(unittest.TestCase):
     """
     Base test case class for Mixer.
@@ -104,27 +117,55 @@ class MixerTestCase(unittest.TestCase):
             # start all the blenders
             window_width = int(1920 / len(blenderdescs))
 
+            blenders = []
+            blenders_args = []
+            blenders_shared_folders = []
             for i, blenderdesc in enumerate(blenderdescs):
                 shared_folders = self.shared_folders[i] if i < len(self.shared_folders) else []
                 if not isinstance(shared_folders, (list, tuple)):
                     self.fail(f"shared_folder must be a list or tuple, not a {type(shared_folders)}")
+                blenders_shared_folders.append(shared_folders)
 
                 window_x = str(i * window_width)
                 args = ["--window-geometry", window_x, "0", "960", "1080"]
                 if blenderdesc.load_file is not None:
                     args.append(str(blenderdesc.load_file))
+                blenders_args.append(args)
+
                 blender = BlenderApp(python_port + i, ptvsd_port + i, blenderdesc.wait_for_debugger)
                 blender.set_log_level(self._log_level)
-                blender.setup(args)
-                if join:
+                blenders.append(blender)
+
+            def setup_blender(blender: BlenderApp, args: List[str]):
+                try:
+                    blender.setup(args)
+                except Exception:
+                    # the process may be running although its python server could not be reached
+                    blender.kill()
+                    raise
+
+            # each Blender listens on its own port, so they can start and be connected to concurrently
+            with ThreadPoolExecutor(max_workers=len(blenders)) as executor:
+                futures = [
+                    executor.submit(setup_blender, blender, args) for blender, args in zip(blenders, blenders_args)
+                ]
+
+            # only keep track of the started Blenders, so that shutdown() does not send them commands
+            for blender, future in zip(blenders, futures):
+                if future.exception() is None:
+                    self._blenders.append(blender)
+            for future in futures:
+                future.result()
+
+            if join:
+                # the first Blender creates the room, the others join it
+                for i, (blender, shared_folders) in enumerate(zip(self._blenders, blenders_shared_folders)):
                     blender.connect_mixer()
                     if i == 0:
                         blender.create_room(vrtist_protocol=self.vrtist_protocol, shared_folders=shared_folders)
                     else:
                         blender.join_room(vrtist_protocol=self.vrtist_protocol, shared_folders=shared_folders)
 
-                self._blenders.append(blender)
-
             # join_room waits for the room to be joinable before issuing join room, but it
             # cannot wait for the reception of the room contents
             time.sleep(10 * self.latency)
@@ -139,16 +180,31 @@ class MixerTestCase(unittest.TestCase):
         super().tearDown()
 
     def shutdown(self):
-        # quit and wait
+        # quit all, then wait for all at once
+        quit_accepted = []
         for blender in self._blenders:
             try:
                 blender.quit()
-                blender.wait()
-                blender.close()
+                quit_accepted.append(True)
             except Exception:
                 # always close server
+                quit_accepted.append(False)
+
+        quit_timeout = 30
+
+        def wait_and_close(blender: BlenderApp, accepted: bool):
+            try:
+                # do not wait forever for a Blender that did not receive quit() or did not exit
+                if not accepted or blender.wait(quit_timeout) is None:
+                    blender.kill()
+                blender.close()
+            except Exception:
                 pass
 
+        if self._blenders:
+            with ThreadPoolExecutor(max_workers=len(self._blenders)) as executor:
+                list(executor.map(wait_and_close, self._blenders, quit_accepted))
+
         self._server_process.kill()
         mixer.codec.unregister()
 
@@ -164,50 +220,50 @@ class MixerTestCase(unittest.TestCase):
         except Exception as e:
             raise self.failureException(f"Exception during disconnect():\n{e!r}\nPossible Blender crash") from None
 
-        # wait for disconnect before killing the server. Avoids a disconnect operator context error message
-        time.sleep(0.5)
+        # wait for disconnect before reconnecting to upload the rooms to grab.
+        # Avoids a disconnect operator context error message
+        disconnect_timeout = 5
+        if not self._server_process.wait_until(_no_other_client, timeout=disconnect_timeout):
+            raise self.failureException(f"Blender still connected after {disconnect_timeout} seconds")
 
-        self._server_process.kill()
+        # The grab rooms have their own names, so the test server can be reused, unless it is throttled
+        if self._server_process.server_args:
+            self._server_process.kill()
+            self._server_process.start()
 
-        # start a broadcaster server to grab the room
-        server_process = ServerProcess()
-        server_process.start()
-        try:
-            host = server_process.host
-            port = server_process.port
-
-            scene_upload_delay = 1
-            # Bumping the delay is required when running the tests from VScode text explorer
-            # in debug on a "slow" machine. Otherwise either Blender disconnects before the room
-            # content has been sent or the grabber tries to join the room before it is joinable.
-            # It probably helps solving random failures on the Gitlab runner as well.
-            vscode_debug_delay = 2
-            scene_upload_delay += vscode_debug_delay
-
-            grabbers = []
-            for i, blender in enumerate(self._blenders):
-                # blender upload room
-                blender.connect_mixer()
-                shared_folders = self.shared_folders[i] if i < len(self.shared_folders) else []
-                blender.create_room(
-                    f"mixer_grab_{i}",
-                    keep_room_open=True,
-                    vrtist_protocol=self.vrtist_protocol,
-                    shared_folders=shared_folders,
-                )
-                time.sleep(scene_upload_delay)
-                blender.disconnect_mixer()
+        host = self._server_process.host
+        port = self._server_process.port
 
-                # download the room
-                grabber = Grabber()
-                grabbers.append(grabber)
-                try:
-                    grabber.grab(host, port, f"mixer_grab_{i}")
-                except Exception as e:
-                    raise self.failureException(f"Grab {i}: ", *e.args) from None
+        # Generous, since the upload is slow when running the tests from VScode text explorer in debug
+        scene_upload_timeout = 30
 
-        finally:
-            server_process.kill()
+        grabbers = []
+        for i, blender in enumerate(self._blenders):
+            # blender upload room
+            room_name = f"mixer_grab_{i}"
+            blender.connect_mixer()
+            shared_folders = self.shared_folders[i] if i < len(self.shared_folders) else []
+            blender.create_room(
+                room_name,
+                keep_room_open=True,
+                vrtist_protocol=self.vrtist_protocol,
+                shared_folders=shared_folders,
+            )
+            # Wait for the upload, otherwise either Blender disconnects before the room content has been sent
+            # or the grabber tries to join the room before it is joinable.
+            if not self._server_process.wait_until(
+                lambda client: _is_room_uploaded(client, room_name), timeout=scene_upload_timeout
+            ):
+                raise self.failureException(f"Room {room_name} not uploaded after {scene_upload_timeout} seconds")
+            blender.disconnect_mixer()
+
+            # download the room
+            grabber = Grabber()
+            grabbers.append(grabber)
+            try:
+                grabber.grab(host, port, room_name)
+            except Exception as e:
+                raise self.failureException(f"Grab {i}: ", *e.args) from None
 
         s = grabbers[0].streams
         r = grabbers[1].streams
@@ -10,6 +10,7 @@ from typing import Any, Callable, Iterable, List, Mapping, Optional
 
 import tests.blender_lib as blender_lib
 
+from mixer.broadcaster.client import Client
 from mixer.broadcaster.common import DEFAULT_PORT, encode_int
 
 """
@@ -268,6 +269,7 @@ class ServerProcess(PythonProcess):
         super().__init__()
         self.port: int = int(os.environ.get("VRTIST_PORT", DEFAULT_PORT))
         self.host: str = "127.0.0.1"
+        self.server_args: Optional[List[str]] = None
 
     def start(self, server_args: Optional[List[str]] = None):
         # do not use an existing server, since it might not be ours and might not be setup
@@ -284,9 +286,29 @@ class ServerProcess(PythonProcess):
         args.extend(["--log-level", "WARNING"])
         if server_args:
             args.extend(server_args)
+        self.server_args = server_args
         super().start(args)
         self._test_connect(timeout=4)
 
+    def wait_until(self, predicate: Callable[[Client], bool], timeout: float) -> bool:
+        """
+        Connect a client to the broadcaster and wait until predicate(client) is True, with the client views of
+        the clients and rooms kept up to date by the server.
+
+        Return False if the predicate is still False after timeout seconds.
+        """
+        end_time = time.monotonic() + timeout
+        with Client(self.host, self.port) as client:
+            while client.is_connected():
+                # wait for the initial client list, that contains this client, before testing
+                if client.client_id in client.clients_attributes and predicate(client):
+                    return True
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    break
+                client.fetch_incoming_commands(timeout=min(remaining, 0.1))
+        return False
+
     def _test_connect(self, timeout: float = 0.0):
         waited = 0.0
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)